@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from math import sqrt
+
+from cache import TTLCache
+
+ACCOUNT_CACHE_TTL = 60 * 60  # seconds; follower counts and bios change slowly
+ACCOUNT_CACHE_SIZE = 5000
+
+
+class Account:
+    """The per-author values derived from a Mastodon account dict.
+
+    Computed once per account and shared by every post that account authored.
+    """
+
+    __slots__ = ("id", "acct", "inverse_follower_weight", "opted_out", "is_self")
+
+    def __init__(self, info: dict, viewer_acct: str):
+        self.id = info["id"]
+        self.acct = info["acct"]
+        # Zero out accounts with zero followers (it happens), or less (count is -1 when the followers count is hidden)
+        if info["followers_count"] <= 0:
+            self.inverse_follower_weight = 0
+        else:
+            # inversely weight against how big the account is
+            self.inverse_follower_weight = 1 / sqrt(info["followers_count"])
+        note = info["note"].lower()
+        self.opted_out = "#noindex" in note or "#nobot" in note
+        self.is_self = info["acct"].strip().lower() == viewer_acct
+
+
+class AccountCache:
+    """Caches derived Account values across digests, keyed by viewer and account id"""
+
+    def __init__(self, ttl: float = ACCOUNT_CACHE_TTL, max_size: int = ACCOUNT_CACHE_SIZE):
+        self._cache = TTLCache(ttl, max_size)
+
+    def get(self, info: dict, viewer_acct: str) -> Account:
+        return self._cache.get_or_set(
+            (viewer_acct, info["id"]), lambda: Account(info, viewer_acct)
+        )
+
+
+# Shared by every digest built in this process
+account_cache = AccountCache()
@@ -3,21 +3,26 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
+from accounts import account_cache as default_account_cache
 from models import ScoredPost
 
 if TYPE_CHECKING:
+    from accounts import AccountCache
     from mastodon import Mastodon
     from scorers import Scorer
 
 
 def fetch_posts_and_boosts(
     hours: int, mastodon_client: Mastodon, timeline: str,
-    scorer: Scorer
+    scorer: Scorer, account_cache: AccountCache | None = None
 ) -> tuple[list[ScoredPost], list[ScoredPost]]:
     """Fetches posts from the home timeline that the account hasn't interacted with"""
 
     TIMELINE_LIMIT = 1000  # Should this be documented? Configurable?
 
+    if account_cache is None:
+        account_cache = default_account_cache
+
     # First, get our filters
     filters = mastodon_client.filters()
 
@@ -71,7 +76,9 @@ def fetch_posts_and_boosts(
                 post = post["reblog"]  # look at the boosted post
                 boost = True
 
-            scored_post = ScoredPost(post, scorer)  # wrap the post data as a ScoredPost
+            # The post carries only the shared Account reference, not the full account dict
+            account = account_cache.get(post.pop("account"), mastodon_acct)
+            scored_post = ScoredPost(post, account, scorer)  # wrap the post data as a ScoredPost
 
             if scored_post.url not in seen_post_urls:
                 # Apply our local filters
@@ -81,9 +88,8 @@ def fetch_posts_and_boosts(
                     not scored_post.info["reblogged"]
                     and not scored_post.info["favourited"]
                     and not scored_post.info["bookmarked"]
-                    and scored_post.info["account"]["acct"].strip().lower() != mastodon_acct
-                    and "#noindex" not in scored_post.info["account"]["note"].lower()
-                    and "#nobot" not in scored_post.info["account"]["note"].lower()
+                    and not account.is_self
+                    and not account.opted_out
                 ):
                     # Append to either the boosts list or the posts lists
                     if boost:
@@ -3,12 +3,14 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from accounts import Account
     from scorers import Scorer
 
 
 class ScoredPost:
-    def __init__(self, info: dict, scorer: Scorer):
+    def __init__(self, info: dict, account: Account, scorer: Scorer):
         self.info = info
+        self.account = account
         self.scorer = scorer
         self._score = None
         self._debug_score = None
@@ -39,7 +41,7 @@ class ScoredPost:
         return "\n".join([f"{key}: {self.debug_score[key]}" for key in self.debug_score])
 
     def get_home_url(self, mastodon_base_url: str) -> str:
-        return f"{mastodon_base_url}/@{self.info['account']['acct']}/{self.info['id']}"
+        return f"{mastodon_base_url}/@{self.account.acct}/{self.info['id']}"
 
     @property
     def score(self) -> float:
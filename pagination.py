@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from cache import TTLCache
+from renderer import render
+
+if TYPE_CHECKING:
+    from models import ScoredPost
+
+WINDOW_CACHE_TTL = 10 * 60  # seconds a scored window stays pageable
+WINDOW_CACHE_SIZE = 32
+
+# Scored digests (see digest.fetch_digest), keyed by window id
+window_cache = TTLCache(WINDOW_CACHE_TTL, WINDOW_CACHE_SIZE)
+
+# Paged in place of a digest with no posts or boosts
+EMPTY_WINDOW = {"posts": [], "boosts": [], "mastodon_base_url": None}
+
+
+def new_window_id() -> str:
+    """Returns a unique id for a newly scored window, so cursors never outlive the window they page through"""
+
+    return uuid4().hex
+
+
+def encode_cursor(window_id: str, posts_offset: int, boosts_offset: int) -> str:
+    """Returns an opaque cursor pointing at the next page of a scored window"""
+
+    payload = json.dumps([window_id, posts_offset, boosts_offset], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, int, int]:
+    """Returns the window id, posts offset and boosts offset of a cursor
+
+    :raises ValueError: if the cursor is malformed.
+    """
+
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        window_id, posts_offset, boosts_offset = json.loads(payload)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(window_id, str) or not all(
+        isinstance(offset, int) and offset >= 0 for offset in (posts_offset, boosts_offset)
+    ):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return window_id, posts_offset, boosts_offset
+
+
+def get_page(
+        digest: dict,
+        window_id: str,
+        posts_offset: int = 0,
+        boosts_offset: int = 0,
+        page_size: int = 5,
+        debug: bool = False) -> dict:
+    """Returns one page of posts and boosts from a scored digest, with the cursor for the next page
+
+    The posts and boosts are rendered with posts.html.jinja, with score details only when debug is set.
+
+    :raises ValueError: if page_size is less than 1.
+    """
+
+    if page_size < 1:
+        raise ValueError(f"Invalid page size: {page_size}")
+    mastodon_base_url = digest["mastodon_base_url"]
+    posts = digest["posts"][posts_offset:posts_offset + page_size]
+    boosts = digest["boosts"][boosts_offset:boosts_offset + page_size]
+    posts_offset += len(posts)
+    boosts_offset += len(boosts)
+    has_more = posts_offset < len(digest["posts"]) or boosts_offset < len(digest["boosts"])
+    return {
+        "posts_html": render_posts(posts, mastodon_base_url, debug),
+        "boosts_html": render_posts(boosts, mastodon_base_url, debug),
+        "next_cursor": encode_cursor(window_id, posts_offset, boosts_offset) if has_more else None,
+    }
+
+
+def render_posts(posts: list[ScoredPost], mastodon_base_url: str, debug: bool) -> str:
+    return render(
+        {"posts": posts, "mastodon_base_url": mastodon_base_url, "show_score_details": debug},
+        template="posts.html.jinja",
+    )
@@ -4,7 +4,6 @@ import importlib
 import inspect
 from abc import ABC, abstractmethod
 from datetime import datetime
-from math import sqrt
 from typing import TYPE_CHECKING
 
 from scipy import stats
@@ -29,14 +28,8 @@ class UniformWeight(Weight):
 class InverseFollowerWeight(Weight):
     @classmethod
     def weight(cls, scored_post: ScoredPost) -> InverseFollowerWeight:
-        # Zero out posts by accounts with zero followers (it happens), or less (count is -1 when the followers count is hidden)
-        if scored_post.info["account"]["followers_count"] <= 0:
-            weight = 0
-        else:
-            # inversely weight against how big the account is
-            weight = 1 / sqrt(scored_post.info["account"]["followers_count"])
-
-        return weight
+        # Derived once per author, see accounts.Account
+        return scored_post.account.inverse_follower_weight
 
 
 class Scorer(ABC):
@@ -1,10 +1,12 @@
 import os
 
 from flask import Flask
+from flask import jsonify
 from flask import request
 from mastodon import Mastodon
 
 from digest import fetch_digest
+from pagination import EMPTY_WINDOW, decode_cursor, get_page, new_window_id, window_cache
 from renderer import render
 from scorers import AllFactorsWeightedScorer
 from thresholds import get_threshold_from_name
@@ -20,6 +22,8 @@ mst = Mastodon(
 DEFAULT_HOURS = 12
 DEFAULT_THRESHOLD = 'normal'
 DEFAULT_TIMELINE = 'home'
+DEFAULT_PAGE_SIZE = 5
+MAX_PAGE_SIZE = 40
 
 
 @app.route('/')
@@ -29,11 +33,10 @@ def index():
     return render({}, template='comparison.html.jinja')
 
 
-@app.route('/feed/generate', methods=['POST'])
-def get_feed():
-    # POST data
-    jdata = request.get_json()
-    hours = int(jdata.get('hours')) or DEFAULT_HOURS
+def get_digest_settings(jdata: dict) -> tuple:
+    """Returns the hours, scorer, threshold and timeline from the feed settings POST data"""
+
+    hours = int(jdata.get('hours') or DEFAULT_HOURS)
     scorer = AllFactorsWeightedScorer(
         favourites_weight=float(jdata.get('favourites_weight') or 0),
         reblogs_weight=float(jdata.get('reblogs_weight') or 0),
@@ -41,6 +44,38 @@ def get_feed():
         inverse_follower_boost=bool(int(jdata.get('inverse_follower_boost') or 0)))
     threshold = get_threshold_from_name(jdata.get('threshold') or DEFAULT_THRESHOLD)
     timeline = jdata.get('timeline') or DEFAULT_TIMELINE
-    digest_data = fetch_digest(mst, mastodon_base_url, hours, scorer, threshold, timeline, limit=5)
-    # From args return feed HTML or JSON
-    return render(digest_data, template='digest.html.jinja')
+    return hours, scorer, threshold, timeline
+
+
+@app.route('/feed/page', methods=['POST'])
+def get_feed_page():
+    # POST data: either the feed settings for the first page, or the cursor returned with the previous page
+    jdata = request.get_json()
+    try:
+        page_size = max(1, min(int(jdata.get('page_size') or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE))
+        debug = bool(int(jdata.get('debug') or 0))
+    except (TypeError, ValueError) as e:
+        return jsonify(error=str(e)), 400
+    cursor = jdata.get('cursor')
+    if cursor:
+        try:
+            window_id, posts_offset, boosts_offset = decode_cursor(cursor)
+        except ValueError as e:
+            return jsonify(error=str(e)), 400
+        digest_data = window_cache.get(window_id)
+        if digest_data is None:
+            return jsonify(error='Feed has expired, please regenerate it.'), 410
+    else:
+        try:
+            hours, scorer, threshold, timeline = get_digest_settings(jdata)
+        except (KeyError, TypeError, ValueError) as e:
+            return jsonify(error=f'Invalid feed settings: {e}'), 400
+        # Every first page scores a fresh window, so regenerating a feed always picks up new posts
+        window_id = new_window_id()
+        posts_offset = boosts_offset = 0
+        digest_data = fetch_digest(mst, mastodon_base_url, hours, scorer, threshold, timeline)
+        if digest_data is None:
+            digest_data = EMPTY_WINDOW
+        else:
+            window_cache.set(window_id, digest_data)
+    return jsonify(get_page(digest_data, window_id, posts_offset, boosts_offset, page_size, debug))
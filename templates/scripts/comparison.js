@@ -1,37 +1,102 @@
+var MASTODON_EMBED_SCRIPT = 'https://static-cdn.mastodon.social/embed.js';
+
 function Feed(columnId) {
     this.selector = {
         results: '#feed-' + columnId,
         loader: '#loader-' + columnId,
         settings: '#settings-' + columnId
     };
+    this.cursor = null;
+    this.debug = 0;
+    this.xhr = null;
     this.init();
 };
 
 
-Feed.prototype.fetch = function() {
+Feed.prototype.request = function(postData, done) {
     var _this = this;
-    var serializedData = $(this.selector.settings).serializeArray();
-    var postData = {};
-    serializedData.forEach(function (elem) {
-        postData[elem['name']] = elem['value'];
-    });
-    $.ajax({
+    postData.debug = this.debug;
+    var xhr = $.ajax({
         beforeSend: function (xhr) {
-            $(_this.selector.loader).toggle();
-            $(_this.selector.results).html('');
+            $(_this.selector.loader).show();
             xhr.setRequestHeader('Content-Type', 'application/json');
         },
         data: JSON.stringify(postData),
+        dataType: 'json',
         method: 'POST',
-        url: '/feed/generate'
-    }).always(function () {
-        $(_this.selector.loader).toggle();
-    }).done(function (data) {
-        $(_this.selector.settings).parent('.settings').prop('open', null);
-        $(_this.selector.results).html(data);
+        url: '/feed/page'
+    });
+    this.xhr = xhr;
+    // Responses of requests superseded by a newer fetch() are ignored.
+    xhr.done(function (data) {
+        if (xhr !== _this.xhr) {
+            return;
+        }
+        _this.cursor = data.next_cursor;
+        done(data);
     }).fail(function (data) {
+        if (xhr !== _this.xhr) {
+            return;
+        }
         window.console.log(data);
+        if (data.status === 400 || data.status === 410) {
+            // The cursor won't get any better by retrying it: stop paging until the feed is regenerated.
+            _this.cursor = null;
+            var message = data.responseJSON ? data.responseJSON.error : 'Could not load more posts.';
+            $(_this.selector.results).append($('<div class="post"></div>').text(message));
+        }
+    }).always(function () {
+        if (xhr !== _this.xhr) {
+            return;
+        }
+        _this.xhr = null;
+        $(_this.selector.loader).hide();
+    });
+}
+
+Feed.prototype.fetch = function() {
+    var _this = this;
+    var serializedData = $(this.selector.settings).serializeArray();
+    var postData = {};
+    serializedData.forEach(function (elem) {
+        postData[elem['name']] = elem['value'];
+    });
+    if (this.xhr) {
+        // Drop whatever page of the previous feed is still loading.
+        var xhr = this.xhr;
+        this.xhr = null;
+        xhr.abort();
+    }
+    this.cursor = null;
+    this.debug = parseInt(postData.debug || 0);
+    $(this.selector.results).html('');
+    this.request(postData, function (data) {
+        $(_this.selector.settings).parent('.settings').prop('open', null);
+        $(_this.selector.results).html(
+            '<div class="container">' +
+            '<section class="posts"><h2>Popular posts:</h2></section>' +
+            '<section class="posts"><h2>Popular boosts:</h2></section>' +
+            '</div>'
+        );
+        _this.append(data);
+    });
+}
+
+Feed.prototype.fetchNext = function() {
+    if (!this.cursor || this.xhr) {
+        return;
+    }
+    this.request({cursor: this.cursor}, this.append.bind(this));
+}
+
+Feed.prototype.append = function(data) {
+    var sections = $(this.selector.results).find('section.posts');
+    sections.eq(0).append(data.posts_html);
+    sections.eq(1).append(data.boosts_html);
+    sections.each(function () {
+        $(this).toggle($(this).children('.post').length > 0);
     });
+    registerEmbeds();
 }
 
 Feed.prototype.init = function() {
@@ -42,6 +107,18 @@ Feed.prototype.init = function() {
     });
 };
 
+// Mastodon's embed script only sets up the height-resizing of the embed iframes present when it runs,
+// so it is run again whenever posts are added.
+function registerEmbeds() {
+    var script = document.createElement('script');
+    script.src = MASTODON_EMBED_SCRIPT;
+    script.async = true;
+    script.onload = function () {
+        script.remove();
+    };
+    document.body.appendChild(script);
+}
+
 $(document).ready(function() {
     // Auto-fetch the first two feeds (we have default settings).
     var feed1 = new Feed('1');
@@ -50,4 +127,13 @@ $(document).ready(function() {
     feed2.fetch();
     // Don't fetch the last feed, it's for user-generated settings.
     var feed3 = new Feed('3');
+
+    // Infinite scroll: fetch the next page of every feed when nearing the bottom of the page.
+    $(window).scroll(function () {
+        if ($(window).scrollTop() + $(window).height() > $(document).height() - 400) {
+            [feed1, feed2, feed3].forEach(function (feed) {
+                feed.fetchNext();
+            });
+        }
+    });
 });
@@ -0,0 +1,34 @@
+from accounts import Account, AccountCache
+
+
+def account_info(**kwargs) -> dict:
+    info = {"id": "1", "acct": "Someone@example.social", "followers_count": 100, "note": ""}
+    info.update(kwargs)
+    return info
+
+
+def test_account_inverse_follower_weight():
+    assert Account(account_info(followers_count=100), "me").inverse_follower_weight == 0.1
+    assert Account(account_info(followers_count=0), "me").inverse_follower_weight == 0
+    # Hidden follower counts are reported as -1
+    assert Account(account_info(followers_count=-1), "me").inverse_follower_weight == 0
+
+
+def test_account_opted_out():
+    assert not Account(account_info(note="<p>Hello</p>"), "me").opted_out
+    assert Account(account_info(note="<p>#NoIndex</p>"), "me").opted_out
+    assert Account(account_info(note="<p>#nobot</p>"), "me").opted_out
+
+
+def test_account_is_self():
+    assert Account(account_info(acct=" Me "), "me").is_self
+    assert not Account(account_info(acct="someone"), "me").is_self
+
+
+def test_account_cache_is_keyed_by_viewer_and_account():
+    account_cache = AccountCache()
+    info = account_info(acct="me")
+    account = account_cache.get(info, "me")
+    assert account_cache.get(account_info(acct="me", followers_count=4), "me") is account
+    assert not account_cache.get(info, "someone-else").is_self
+    assert account_cache.get(account_info(id="2"), "me") is not account
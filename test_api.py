@@ -0,0 +1,61 @@
+from unittest import mock
+
+from accounts import AccountCache
+from api import fetch_posts_and_boosts
+from scorers import SimpleScorer
+
+
+def account_info(id: str, acct: str, note: str = "") -> dict:
+    return {"id": id, "acct": acct, "followers_count": 100, "note": note}
+
+
+def status(id: str, account: dict, reblog: dict = None) -> dict:
+    return {
+        "id": id,
+        "url": f"https://example.social/@{account['acct']}/{id}",
+        "account": account,
+        "reblog": reblog,
+        "reblogged": False,
+        "favourited": False,
+        "bookmarked": False,
+        "favourites_count": 1,
+        "reblogs_count": 1,
+        "replies_count": 0,
+    }
+
+
+def fake_client(statuses: list[dict]) -> mock.Mock:
+    client = mock.Mock()
+    client.filters.return_value = []
+    client.me.return_value = {"acct": "Me"}
+    client.timeline.return_value = statuses
+    client.fetch_previous.return_value = None
+    return client
+
+
+def test_fetch_posts_and_boosts_shares_accounts_and_drops_account_dicts():
+    author = account_info("1", "author")
+    booster = account_info("2", "booster")
+    client = fake_client([
+        status("10", dict(author)),
+        status("11", dict(author)),
+        status("12", booster, reblog=status("13", dict(author))),
+    ])
+    posts, boosts = fetch_posts_and_boosts(12, client, "home", SimpleScorer(), AccountCache())
+    assert [post.info["id"] for post in posts] == ["10", "11"]
+    assert [boost.info["id"] for boost in boosts] == ["13"]
+    assert posts[0].account is posts[1].account is boosts[0].account
+    assert posts[0].account.acct == "author"
+    assert all("account" not in post.info for post in posts + boosts)
+
+
+def test_fetch_posts_and_boosts_filters_self_and_opted_out_authors():
+    client = fake_client([
+        status("10", account_info("1", "me")),
+        status("11", account_info("2", "nobot", note="<p>#NoBot</p>")),
+        status("12", account_info("3", "noindex", note="<p>#noindex</p>")),
+        status("13", account_info("4", "author")),
+    ])
+    posts, boosts = fetch_posts_and_boosts(12, client, "home", SimpleScorer(), AccountCache())
+    assert [post.info["id"] for post in posts] == ["13"]
+    assert boosts == []
@@ -0,0 +1,101 @@
+import os
+from unittest import mock
+
+import pytest
+
+os.environ.setdefault("MASTODON_BASE_URL", "https://home.social")
+
+from server import application  # noqa: E402
+from pagination import encode_cursor  # noqa: E402
+
+
+class FakePost:
+    score = 1.5
+    debug_score_string = "score: 1.5"
+
+    def __init__(self, id: int):
+        self.id = id
+        self.url = f"https://example.social/@someone/{id}"
+
+    def get_home_url(self, mastodon_base_url: str) -> str:
+        return f"{mastodon_base_url}/@someone/{self.id}"
+
+
+def fake_digest(*args, **kwargs) -> dict:
+    return {
+        "posts": [FakePost(i) for i in range(7)],
+        "boosts": [],
+        "mastodon_base_url": "https://home.social",
+    }
+
+
+@pytest.fixture
+def fetch_digest():
+    with mock.patch.object(application, "fetch_digest", side_effect=fake_digest) as fetch_digest:
+        yield fetch_digest
+
+
+@pytest.fixture
+def client():
+    return application.app.test_client()
+
+
+def test_feed_page_pages_through_one_scored_window(client, fetch_digest):
+    response = client.post("/feed/page", json={"page_size": 3})
+    assert response.status_code == 200
+    assert response.get_json()["posts_html"].count('class="post"') == 3
+    cursor = response.get_json()["next_cursor"]
+
+    response = client.post("/feed/page", json={"cursor": cursor, "page_size": 3})
+    assert response.status_code == 200
+    assert "@someone/3" in response.get_json()["posts_html"]
+    assert response.get_json()["next_cursor"] is not None
+    fetch_digest.assert_called_once()
+
+
+def test_feed_page_first_page_scores_a_new_window(client, fetch_digest):
+    first_cursor = client.post("/feed/page", json={}).get_json()["next_cursor"]
+    second_cursor = client.post("/feed/page", json={}).get_json()["next_cursor"]
+    assert fetch_digest.call_count == 2
+    assert first_cursor != second_cursor
+
+
+def test_feed_page_of_empty_timeline(client):
+    with mock.patch.object(application, "fetch_digest", return_value=None):
+        response = client.post("/feed/page", json={})
+    assert response.status_code == 200
+    assert response.get_json()["next_cursor"] is None
+
+
+def test_feed_page_clamps_page_size(client, fetch_digest):
+    response = client.post("/feed/page", json={"page_size": -3})
+    assert response.status_code == 200
+    assert response.get_json()["posts_html"].count('class="post"') == 1
+
+
+def test_feed_page_rejects_expired_windows(client, fetch_digest):
+    cursor = client.post("/feed/page", json={}).get_json()["next_cursor"]
+    with mock.patch("cache.monotonic", return_value=float("inf")):
+        response = client.post("/feed/page", json={"cursor": cursor})
+    assert response.status_code == 410
+    assert "error" in response.get_json()
+
+
+def test_feed_page_rejects_unknown_windows(client):
+    response = client.post("/feed/page", json={"cursor": encode_cursor("unknown", 5, 0)})
+    assert response.status_code == 410
+
+
+@pytest.mark.parametrize("data", [
+    {"cursor": "not a cursor!"},
+    {"page_size": "many"},
+    {"debug": "true"},
+    {"threshold": "nonexistent"},
+    {"hours": "twelve"},
+    {"favourites_weight": "lots"},
+])
+def test_feed_page_rejects_invalid_requests(client, fetch_digest, data):
+    response = client.post("/feed/page", json=data)
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+    fetch_digest.assert_not_called()
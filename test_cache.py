@@ -0,0 +1,75 @@
+from threading import Event, Thread, current_thread
+from unittest import mock
+
+from cache import TTLCache
+
+
+def test_ttl_cache_expires_entries():
+    cache = TTLCache(ttl=10, max_size=10)
+    with mock.patch("cache.monotonic", return_value=100):
+        cache.set("key", "value")
+    with mock.patch("cache.monotonic", return_value=109):
+        assert cache.get("key") == "value"
+    with mock.patch("cache.monotonic", return_value=110):
+        assert cache.get("key") is None
+        assert cache.get("key", "default") == "default"
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(ttl=10, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_get_or_set_only_builds_on_miss():
+    cache = TTLCache(ttl=10, max_size=10)
+    factory = mock.Mock(return_value="value")
+    assert cache.get_or_set("key", factory) == "value"
+    assert cache.get_or_set("key", factory) == "value"
+    factory.assert_called_once_with()
+
+
+def test_ttl_cache_get_or_set_builds_once_for_concurrent_misses():
+    cache = TTLCache(ttl=10, max_size=10)
+    building = Event()
+    second_missed = Event()
+    release = Event()
+
+    def build():
+        building.set()
+        release.wait()
+        return "value"
+
+    def get(key, default=None):
+        value = TTLCache.get(cache, key, default)
+        if current_thread() is threads[1] and value is default:
+            second_missed.set()
+        return value
+
+    factory = mock.Mock(side_effect=build)
+    results = []
+    threads = [Thread(target=lambda: results.append(cache.get_or_set("key", factory))) for _ in range(2)]
+    with mock.patch.object(cache, "get", side_effect=get):
+        threads[0].start()
+        building.wait()
+        threads[1].start()
+        # Only let the first build finish once the second thread has missed too
+        second_missed.wait()
+        release.set()
+        for thread in threads:
+            thread.join()
+    assert results == ["value", "value"]
+    factory.assert_called_once_with()
+
+
+def test_ttl_cache_get_or_set_caches_none():
+    cache = TTLCache(ttl=10, max_size=10)
+    factory = mock.Mock(return_value=None)
+    assert cache.get_or_set("key", factory) is None
+    assert cache.get_or_set("key", factory) is None
+    factory.assert_called_once_with()
@@ -0,0 +1,90 @@
+import re
+
+import pytest
+
+from pagination import EMPTY_WINDOW, decode_cursor, encode_cursor, get_page, new_window_id
+
+
+class FakePost:
+    score = 1.5
+    debug_score_string = "score: 1.5"
+
+    def __init__(self, id: int):
+        self.id = id
+        self.url = f"https://example.social/@someone/{id}"
+
+    def get_home_url(self, mastodon_base_url: str) -> str:
+        return f"{mastodon_base_url}/@someone/{self.id}"
+
+
+def digest(posts: int, boosts: int) -> dict:
+    return {
+        "posts": [FakePost(i) for i in range(posts)],
+        "boosts": [FakePost(i) for i in range(boosts)],
+        "mastodon_base_url": "https://home.social",
+    }
+
+
+def rendered_ids(html: str) -> list[int]:
+    return [int(id) for id in re.findall(r'class="home-link" href="https://home.social/@someone/(\d+)"', html)]
+
+
+def test_new_window_id_is_unique():
+    assert new_window_id() != new_window_id()
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor("abc123", 5, 10)) == ("abc123", 5, 10)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    encode_cursor("abc123", 5, 10)[:-3],
+    encode_cursor("abc123", -1, 0),
+    encode_cursor(1, 0, 0),
+])
+def test_decode_cursor_rejects_invalid_cursors(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_get_page_pages_through_posts_and_boosts():
+    window = digest(posts=7, boosts=3)
+    page = get_page(window, "abc123", page_size=3)
+    assert rendered_ids(page["posts_html"]) == [0, 1, 2]
+    assert rendered_ids(page["boosts_html"]) == [0, 1, 2]
+    assert decode_cursor(page["next_cursor"]) == ("abc123", 3, 3)
+
+    page = get_page(window, "abc123", 3, 3, page_size=3)
+    assert rendered_ids(page["posts_html"]) == [3, 4, 5]
+    assert rendered_ids(page["boosts_html"]) == []
+    assert decode_cursor(page["next_cursor"]) == ("abc123", 6, 3)
+
+    page = get_page(window, "abc123", 6, 3, page_size=3)
+    assert rendered_ids(page["posts_html"]) == [6]
+    assert page["next_cursor"] is None
+
+
+def test_get_page_of_exact_multiple_has_no_next_cursor():
+    page = get_page(digest(posts=3, boosts=0), "abc123", page_size=3)
+    assert rendered_ids(page["posts_html"]) == [0, 1, 2]
+    assert page["next_cursor"] is None
+
+
+def test_get_page_of_empty_window():
+    page = get_page(EMPTY_WINDOW, "abc123")
+    assert page["posts_html"].strip() == ""
+    assert page["boosts_html"].strip() == ""
+    assert page["next_cursor"] is None
+
+
+@pytest.mark.parametrize("debug", [False, True])
+def test_get_page_only_shows_score_details_for_debug(debug):
+    page = get_page(digest(posts=1, boosts=0), "abc123", debug=debug)
+    assert ("Score: 1.5" in page["posts_html"]) == debug
+
+
+@pytest.mark.parametrize("page_size", [0, -3])
+def test_get_page_rejects_invalid_page_size(page_size):
+    with pytest.raises(ValueError):
+        get_page(digest(posts=7, boosts=0), "abc123", page_size=page_size)